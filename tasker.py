@@ -1,16 +1,27 @@
 """Main module of app."""
 __all__ = [
     'TaskData', 'main', 'check_db', 'read_db', 'write_db', 'add',
-    'update', 'delete', 'mark_done', 'mark_in_progress', 'list'
+    'update', 'delete', 'mark_done', 'mark_in_progress', 'list',
+    'read_archive', 'append_archive', 'archive', 'restore'
     ]
 
 import datetime
+import gzip
 import json
 import os
+import shutil
 import sys
+import zlib
+from collections.abc import Iterable, Iterator
 from typing import TypedDict
 
 DB_FILE = 'tasks.json'
+# cold store for done tasks: gzipped json lines, only appended to
+ARCHIVE_FILE = 'tasks_archive.jsonl.gz'
+# automatic archiving of tasks done for more than N days (unset - disabled)
+ARCHIVE_AFTER_DAYS = os.environ.get('TASKER_ARCHIVE_AFTER_DAYS')
+# format of 'created' and 'updated' task fields
+DATETIME_FORMAT = '%d.%m.%Y %H:%M'
 # varibale for check count of args
 TWO_ARGS = 2
 # varibale for check length of description
@@ -60,6 +71,8 @@ def main() -> None:
         print(err)
     except TypeError as err:
         print(err)
+    except (gzip.BadGzipFile, EOFError, zlib.error) as err:
+        print(f"Archive '{ARCHIVE_FILE}' is damaged: {err}")
 
 
 def check_db(path: str) -> None:
@@ -82,6 +95,32 @@ def write_db(path: str, python_data: TaskData) -> None:
         json.dump(python_data, file)
 
 
+def read_archive(path: str) -> Iterator[Task]:
+    """Lazily yield archived tasks one by one from the cold store."""
+    if not os.path.exists(path):
+        return
+    with gzip.open(path, 'rt', encoding='utf-8') as file:
+        for line in file:
+            yield json.loads(line)
+
+
+def append_archive(path: str, tasks: Iterable[Task]) -> None:
+    """Append tasks to the end of the cold store.
+
+    Every call adds a new gzip member to a copy of the archive, which then
+    replaces it, so a crash never leaves a half-written member behind.
+    """
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as file:
+        if os.path.exists(path):
+            with open(path, 'rb') as archive_file:
+                shutil.copyfileobj(archive_file, file)
+        with gzip.open(file, 'wt', encoding='utf-8') as gzip_file:
+            for task in tasks:
+                gzip_file.write(json.dumps(task) + '\n')
+    os.replace(tmp_path, path)
+
+
 def _run_cmd(cmd: str, *args: tuple) -> None:
     """Run the provided command with arguments.
 
@@ -93,7 +132,23 @@ def _run_cmd(cmd: str, *args: tuple) -> None:
     match cmd:
         case 'help':
             help()
-            return
+        case 'list':
+            _list_cmd(json_data, *args)
+        case 'restore':
+            # restore saves the db itself before it rewrites the archive
+            restore(
+                json_data, *args,
+                archive_path=ARCHIVE_FILE, db_path=DB_FILE)
+        case _:
+            _run_change_cmd(json_data, cmd, *args)
+
+
+def _run_change_cmd(json_data: TaskData, cmd: str, *args: tuple) -> None:
+    """Run the command that changes tasks and write them to db."""
+    # check the setting before the command changes anything
+    archive_after_days = _archive_after_days()
+
+    match cmd:
         case 'add':
             add(json_data, *args)
         case 'update':
@@ -104,16 +159,47 @@ def _run_cmd(cmd: str, *args: tuple) -> None:
             mark_in_progress(json_data, *args)
         case 'mark-done':
             mark_done(json_data, *args)
-        case 'list':
-            list(json_data, *args)
-            return
+        case 'archive':
+            archive(json_data, *args, archive_path=ARCHIVE_FILE)
         case _:
             raise CommandNotFoundError(cmd)
 
+    _apply_archive_policy(json_data, archive_after_days)
+
     # write data to db
     write_db(DB_FILE, json_data)
 
 
+def _list_cmd(json_data: TaskData, *args: tuple) -> None:
+    """Run list command, '--all' flag adds archived tasks to the output."""
+    if '--all' not in args:
+        list(json_data, *args)
+        return
+    args = tuple(arg for arg in args if arg != '--all')
+    list(json_data, *args, archive_path=ARCHIVE_FILE)
+
+
+def _apply_archive_policy(
+    json_data: TaskData,
+    archive_after_days: int | None) -> None:
+    """Move old done tasks to the cold store if the policy is enabled."""
+    if archive_after_days is not None:
+        archive(json_data, archive_after_days, archive_path=ARCHIVE_FILE)
+
+
+def _archive_after_days() -> int | None:
+    """Return the days of the automatic archive policy or None if unset."""
+    if ARCHIVE_AFTER_DAYS is None:
+        return None
+    try:
+        _is_valid_days(ARCHIVE_AFTER_DAYS)
+    except ValueError:
+        raise ValueError(
+            'TASKER_ARCHIVE_AFTER_DAYS must be int and not less than 0'
+            ) from None
+    return int(ARCHIVE_AFTER_DAYS)
+
+
 def help() -> None:
     """Help command."""
     commands = [
@@ -132,9 +218,17 @@ def help() -> None:
         ("mark-in-progress",
          "mark a task as in-progress. 1 positional arg - id",
          '`mark-in-progress 1`'),
+        ("archive",
+         "move done tasks to the archive. Nothing or 1 positional arg - "
+         "days since done",
+         '`archive`, `archive 30`'),
+        ("restore",
+         "restore a task from the archive. 1 positional arg - id",
+         '`restore 1`'),
         ("list",
-         "print tasks. Nothing or 1 positional arg - done/in-progress/todo",
-         '`list`, `list todo`'),
+         "print tasks. Nothing or 1 positional arg - done/in-progress/todo, "
+         "--all includes archived tasks",
+         '`list`, `list todo`, `list done --all`'),
     ]
 
     for cmd, desc, example in commands:
@@ -162,7 +256,7 @@ def _now_datetime() -> str:
     
     Return format 'DD.MM.YYYY HH:MM' (e.g., '20.07.2025 15:56').
     """
-    return datetime.datetime.now().strftime('%d.%m.%Y %H:%M')
+    return datetime.datetime.now().strftime(DATETIME_FORMAT)
 
 
 def _is_valid_description(desc: str) -> None:
@@ -218,8 +312,93 @@ def mark_done(json_data: TaskData, id: int) -> None:
     _update_task(json_data, id, status='done')          
 
 
-def list(json_data: TaskData, status: str | None = None) -> None:
-    """Show all tasks or tasks filtered by the given status in the console."""
+def archive(
+    json_data: TaskData,
+    days: int | None = None,
+    *,
+    archive_path: str = ARCHIVE_FILE) -> None:
+    """Move done tasks to the archive.
+
+    If days is given, only tasks done for more than this number of days
+    are moved.
+    """
+    border = None
+    if days is not None:
+        _is_valid_days(days)
+        now = _parse_datetime(_now_datetime())
+        border = now - datetime.timedelta(days=int(days))
+
+    archived, hot = [], []
+    for task in json_data['tasks']:
+        if task['status'] == 'done' and (
+                border is None or _parse_datetime(task['updated']) < border):
+            archived.append(task)
+        else:
+            hot.append(task)
+
+    if archived:
+        # append before the db is rewritten: a crash leaves a duplicate,
+        # not a lost task
+        append_archive(archive_path, archived)
+        json_data['tasks'] = hot
+
+
+def _is_valid_days(days: int) -> None:
+    if int(days) < 0:
+        raise ValueError('days must be int and not less than 0')
+
+
+def _parse_datetime(value: str) -> datetime.datetime:
+    return datetime.datetime.strptime(value, DATETIME_FORMAT)
+
+
+def restore(
+    json_data: TaskData,
+    id: int,
+    *,
+    archive_path: str = ARCHIVE_FILE,
+    db_path: str = DB_FILE) -> None:
+    """Return the task by ID from the archive to the list of tracked tasks.
+
+    The db is written before the task is removed from the archive: a crash
+    leaves a duplicate, not a lost task. The 'updated' field is refreshed,
+    so the task is not archived again by the automatic policy right away.
+    """
+    _is_valid_id(id)
+    # the rest of the archive is streamed to a new file without the task
+    restored = None
+    tmp_path = archive_path + '.tmp'
+    with gzip.open(tmp_path, 'wt', encoding='utf-8') as file:
+        for task in read_archive(archive_path):
+            if task['id'] == int(id):
+                restored = task
+            else:
+                file.write(json.dumps(task) + '\n')
+    if restored is None:
+        os.remove(tmp_path)
+        raise IndexError
+
+    restored['updated'] = _now_datetime()
+    # after a crash the task may be in both stores, keep only one copy
+    try:
+        json_data['tasks'][_find_index_of_task(json_data, id)] = restored
+    except IndexError:
+        json_data['tasks'].append(restored)
+        json_data['tasks'].sort(key=lambda task: task['id'])
+    write_db(db_path, json_data)
+
+    os.replace(tmp_path, archive_path)
+
+
+def list(
+    json_data: TaskData,
+    status: str | None = None,
+    *,
+    archive_path: str | None = None) -> None:
+    """Show all tasks or tasks filtered by the given status in the console.
+
+    If archive_path is given, archived tasks are shown after the tracked ones.
+    """
     _is_valid_status(status)
 
     # Show names of task fields
@@ -236,13 +415,28 @@ def list(json_data: TaskData, status: str | None = None) -> None:
     # values of task fields
     for task in json_data['tasks']:
         if not status or task['status'] == status:
-            print(
-                str(task['id']).rjust(2),
-                task['description'].rjust(30),
-                task['status'].rjust(11),
-                task['created'],
-                task['updated'],
-                sep=' | ')
+            _print_task(task)
+
+    # archive is read lazily and only when asked
+    if archive_path is None:
+        return
+    # after a crash a task may be in both stores, show only the tracked one
+    tracked_ids = {task['id'] for task in json_data['tasks']}
+    for task in read_archive(archive_path):
+        if task['id'] in tracked_ids:
+            continue
+        if not status or task['status'] == status:
+            _print_task(task)
+
+
+def _print_task(task: Task) -> None:
+    print(
+        str(task['id']).rjust(2),
+        task['description'].rjust(30),
+        task['status'].rjust(11),
+        task['created'],
+        task['updated'],
+        sep=' | ')
 
 
 def _is_valid_status(status: str) -> None:
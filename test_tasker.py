@@ -363,6 +363,306 @@ class TestListFunction(unittest.TestCase):
             tasker.list(self.json_data, "Buy water")
 
 
+class TestArchiveFunctions(unittest.TestCase):
+    
+    @patch('tasker._now_datetime', return_value="01.01.2025 12:00")
+    def setUp(self, _):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.archive_path = os.path.join(
+            self.temp_dir.name, "temp_archive.jsonl.gz")
+        self.db_path = os.path.join(self.temp_dir.name, "temp_tasks.json")
+        self.json_data: tasker.TaskData = {"tasks": [], "curr_id": 0}
+        tasker.add(self.json_data, "Buy milk")
+        tasker.add(self.json_data, "Buy water")
+        tasker.mark_done(self.json_data, 2)
+        tasker.add(self.json_data, "Buy bread")
+        tasker.mark_done(self.json_data, 3)
+        return super().setUp()
+    
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_archive_moves_done_tasks(self):
+        tasker.archive(self.json_data, archive_path=self.archive_path)
+        archived = [*tasker.read_archive(self.archive_path)]
+        
+        self.assertEqual([task['id'] for task in self.json_data['tasks']], [1])
+        self.assertEqual([task['id'] for task in archived], [2, 3])
+        self.assertEqual(self.json_data["curr_id"], 3)
+    
+    @patch('tasker._now_datetime', return_value="01.02.2025 12:00")
+    def test_archive_by_days_moves_only_old_tasks(self, _):
+        self.json_data["tasks"][1]["updated"] = "01.01.2025 11:59"
+        self.json_data["tasks"][2]["updated"] = "02.01.2025 12:00"
+        
+        tasker.archive(self.json_data, 30, archive_path=self.archive_path)
+        archived = [*tasker.read_archive(self.archive_path)]
+        
+        self.assertEqual(
+            [task['id'] for task in self.json_data['tasks']], [1, 3])
+        self.assertEqual([task['id'] for task in archived], [2])
+    
+    def test_archive_appends_to_existing_archive(self):
+        tasker.mark_done(self.json_data, 1)
+        tasker.archive(self.json_data, archive_path=self.archive_path)
+        tasker.add(self.json_data, "Buy juice")
+        tasker.mark_done(self.json_data, 4)
+        tasker.archive(self.json_data, archive_path=self.archive_path)
+        archived = [*tasker.read_archive(self.archive_path)]
+        
+        self.assertEqual(self.json_data['tasks'], [])
+        self.assertEqual([task['id'] for task in archived], [1, 2, 3, 4])
+
+    def test_archive_raises_value_type_error(self):
+        with self.assertRaises(TypeError):
+            tasker.archive(
+                self.json_data, 1, 1, archive_path=self.archive_path)
+        with self.assertRaises(ValueError):
+            tasker.archive(self.json_data, -1, archive_path=self.archive_path)
+        with self.assertRaises(ValueError):
+            tasker.archive(
+                self.json_data, "Buy water", archive_path=self.archive_path)
+        self.assertFalse(os.path.exists(self.archive_path))
+    
+    @patch('tasker._now_datetime', return_value="01.01.2025 14:00")
+    def test_restore_returns_task_from_archive(self, _):
+        tasker.archive(self.json_data, archive_path=self.archive_path)
+        tasker.restore(
+            self.json_data, 2,
+            archive_path=self.archive_path, db_path=self.db_path)
+        archived = [*tasker.read_archive(self.archive_path)]
+        
+        self.assertEqual(
+            [task['id'] for task in self.json_data['tasks']], [1, 2])
+        self.assertEqual(tasker.read_db(self.db_path), self.json_data)
+        self.assertEqual(self.json_data['tasks'][1]['status'], 'done')
+        self.assertEqual(
+            self.json_data['tasks'][1]['updated'], "01.01.2025 14:00")
+        self.assertEqual([task['id'] for task in archived], [3])
+    
+    def test_restore_ignores_stale_tmp_archive(self):
+        tasker.archive(self.json_data, archive_path=self.archive_path)
+        stale_task = {**self.json_data['tasks'][0], 'id': 99}
+        tasker.append_archive(self.archive_path + '.tmp', [stale_task])
+        
+        tasker.restore(
+            self.json_data, 2,
+            archive_path=self.archive_path, db_path=self.db_path)
+        archived = [*tasker.read_archive(self.archive_path)]
+        
+        self.assertEqual([task['id'] for task in archived], [3])
+    
+    def test_restore_saves_db_before_rewriting_archive(self):
+        tasker.archive(self.json_data, archive_path=self.archive_path)
+        
+        with patch('tasker.os.replace', side_effect=OSError), \
+                self.assertRaises(OSError):
+            tasker.restore(
+                self.json_data, 2,
+                archive_path=self.archive_path, db_path=self.db_path)
+        saved_tasks = tasker.read_db(self.db_path)['tasks']
+        archived = [*tasker.read_archive(self.archive_path)]
+        
+        self.assertEqual([task['id'] for task in saved_tasks], [1, 2])
+        self.assertEqual([task['id'] for task in archived], [2, 3])
+    
+    def test_restore_replaces_duplicate_of_archived_task(self):
+        tasker.append_archive(
+            self.archive_path, [{**self.json_data['tasks'][1]}])
+        
+        tasker.restore(
+            self.json_data, 2,
+            archive_path=self.archive_path, db_path=self.db_path)
+        
+        self.assertEqual(
+            [task['id'] for task in self.json_data['tasks']], [1, 2, 3])
+        self.assertEqual([*tasker.read_archive(self.archive_path)], [])
+    
+    def test_restore_raises_value_type_index_error(self):
+        tasker.archive(self.json_data, archive_path=self.archive_path)
+        
+        with self.assertRaises(TypeError):
+            tasker.restore(self.json_data)
+        with self.assertRaises(ValueError):
+            tasker.restore(self.json_data, 0, archive_path=self.archive_path)
+        with self.assertRaises(IndexError):
+            tasker.restore(self.json_data, 1, archive_path=self.archive_path)
+        with self.assertRaises(IndexError):
+            tasker.restore(
+                self.json_data, 100, archive_path=self.archive_path)
+        self.assertFalse(os.path.exists(self.archive_path + '.tmp'))
+    
+    def test_list_with_archive_prints_tasks_of_both_tiers(self):
+        tasker.archive(self.json_data, archive_path=self.archive_path)
+        output = StringIO()
+        with redirect_stdout(output):
+            tasker.list(self.json_data, archive_path=self.archive_path)
+        output_lines = output.getvalue().splitlines()
+        
+        self.assertEqual(len(output_lines), 5)
+        for i, task_id in enumerate([1, 2, 3]):
+            self.assertTrue(output_lines[2 + i].startswith(f' {task_id} | '))
+    
+    def test_append_archive_crash_keeps_archive_readable(self):
+        tasker.append_archive(self.archive_path, self.json_data['tasks'][:1])
+        
+        with patch('tasker.os.replace', side_effect=OSError), \
+                self.assertRaises(OSError):
+            tasker.append_archive(
+                self.archive_path, self.json_data['tasks'][1:])
+        archived = [*tasker.read_archive(self.archive_path)]
+        
+        self.assertEqual([task['id'] for task in archived], [1])
+    
+    def test_list_with_archive_skips_tasks_still_tracked(self):
+        tasker.append_archive(self.archive_path, self.json_data['tasks'][1:])
+        output = StringIO()
+        with redirect_stdout(output):
+            tasker.list(self.json_data, archive_path=self.archive_path)
+        output_lines = output.getvalue().splitlines()
+        
+        self.assertEqual(len(output_lines), 5)
+    
+    def test_read_archive_without_file_yields_nothing(self):
+        self.assertEqual([*tasker.read_archive(self.archive_path)], [])
+
+
+class TestArchiveCommands(unittest.TestCase):
+    
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, "temp_tasks.json")
+        self.archive_path = os.path.join(
+            self.temp_dir.name, "temp_archive.jsonl.gz")
+        tasker.check_db(self.db_path)
+        patchers = [
+            patch('tasker.DB_FILE', self.db_path),
+            patch('tasker.ARCHIVE_FILE', self.archive_path),
+            patch('tasker.ARCHIVE_AFTER_DAYS', None),
+            ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        return super().setUp()
+    
+    def tearDown(self):
+        self.temp_dir.cleanup()
+    
+    def _saved_ids(self):
+        return [task['id'] for task in tasker.read_db(self.db_path)['tasks']]
+    
+    def _archived_ids(self):
+        return [task['id'] for task in tasker.read_archive(self.archive_path)]
+    
+    def test_invalid_archive_policy_raises_before_changes(self):
+        for value in ('abc', '', '-1'):
+            with patch('tasker.ARCHIVE_AFTER_DAYS', value), \
+                    self.assertRaises(ValueError):
+                tasker._run_cmd('add', 'Buy milk')
+        
+        self.assertEqual(tasker.read_db(self.db_path)['curr_id'], 0)
+    
+    def test_main_prints_message_for_damaged_archive(self):
+        with open(self.archive_path, 'wb') as file:
+            file.write(b'\x1f\x8b\x08\x00damaged')
+        
+        output = StringIO()
+        with patch('sys.argv', ['tasker', 'list', '--all']), \
+                redirect_stdout(output):
+            tasker.main()
+        
+        self.assertIn('is damaged', output.getvalue())
+    
+    def test_invalid_archive_policy_not_checked_on_read_only_commands(self):
+        output = StringIO()
+        with patch('tasker.ARCHIVE_AFTER_DAYS', 'abc'), \
+                redirect_stdout(output):
+            tasker._run_cmd('help')
+            tasker._run_cmd('list', '--all')
+        
+        self.assertNotIn('TASKER_ARCHIVE_AFTER_DAYS', output.getvalue())
+    
+    @patch('tasker._now_datetime', return_value="01.01.2025 12:00")
+    def test_archive_command_moves_done_tasks(self, _):
+        tasker._run_cmd('add', 'Buy milk')
+        tasker._run_cmd('add', 'Buy water')
+        tasker._run_cmd('mark-done', '1')
+        tasker._run_cmd('archive')
+        
+        self.assertEqual(self._saved_ids(), [2])
+        self.assertEqual(self._archived_ids(), [1])
+    
+    def test_archive_command_with_days(self):
+        with patch('tasker._now_datetime', return_value="01.01.2025 12:00"):
+            tasker._run_cmd('add', 'Buy milk')
+            tasker._run_cmd('mark-done', '1')
+        with patch('tasker._now_datetime', return_value="10.01.2025 12:00"):
+            tasker._run_cmd('add', 'Buy water')
+            tasker._run_cmd('mark-done', '2')
+            tasker._run_cmd('archive', '5')
+        
+        self.assertEqual(self._saved_ids(), [2])
+        self.assertEqual(self._archived_ids(), [1])
+    
+    @patch('tasker._now_datetime', return_value="01.01.2025 12:00")
+    def test_restore_command_returns_task(self, _):
+        tasker._run_cmd('add', 'Buy milk')
+        tasker._run_cmd('mark-done', '1')
+        tasker._run_cmd('archive')
+        tasker._run_cmd('restore', '1')
+        
+        self.assertEqual(self._saved_ids(), [1])
+        self.assertEqual(self._archived_ids(), [])
+    
+    @patch('tasker._now_datetime', return_value="01.01.2025 12:00")
+    def test_list_command_with_all_flag(self, _):
+        tasker._run_cmd('add', 'Buy milk')
+        tasker._run_cmd('add', 'Buy water')
+        tasker._run_cmd('mark-done', '1')
+        tasker._run_cmd('archive')
+        
+        output = StringIO()
+        with redirect_stdout(output):
+            tasker._run_cmd('list')
+            tasker._run_cmd('list', '--all')
+            tasker._run_cmd('list', 'done', '--all')
+        output_lines = output.getvalue().splitlines()
+        
+        self.assertEqual(len(output_lines), 3 + 4 + 3)
+        self.assertTrue(output_lines[2].startswith(' 2 | '))
+        self.assertTrue(output_lines[5].startswith(' 2 | '))
+        self.assertTrue(output_lines[6].startswith(' 1 | '))
+        self.assertTrue(output_lines[9].startswith(' 1 | '))
+    
+    def test_archive_policy_moves_old_done_tasks(self):
+        with patch('tasker._now_datetime', return_value="01.01.2025 12:00"):
+            tasker._run_cmd('add', 'Buy milk')
+            tasker._run_cmd('mark-done', '1')
+        with patch('tasker._now_datetime', return_value="10.01.2025 12:00"), \
+                patch('tasker.ARCHIVE_AFTER_DAYS', '5'):
+            tasker._run_cmd('add', 'Buy water')
+            tasker._run_cmd('mark-done', '2')
+        
+        self.assertEqual(self._saved_ids(), [2])
+        self.assertEqual(self._archived_ids(), [1])
+    
+    def test_archive_policy_skipped_on_list_and_restore(self):
+        with patch('tasker._now_datetime', return_value="01.01.2025 12:00"):
+            tasker._run_cmd('add', 'Buy milk')
+            tasker._run_cmd('mark-done', '1')
+            tasker._run_cmd('archive')
+            tasker._run_cmd('add', 'Buy water')
+            tasker._run_cmd('mark-done', '2')
+        with patch('tasker._now_datetime', return_value="10.01.2025 12:00"), \
+                patch('tasker.ARCHIVE_AFTER_DAYS', '5'):
+            tasker._run_cmd('restore', '1')
+            with redirect_stdout(StringIO()):
+                tasker._run_cmd('list')
+        
+        self.assertEqual(self._saved_ids(), [1, 2])
+        self.assertEqual(self._archived_ids(), [])
+
+
 class TestDatabaseFunctions(unittest.TestCase):
     
     def setUp(self):